@@ -1,5 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from io import BytesIO
+from math import ceil
 from typing import Any, Dict, List, Sequence, Type
 
 import numpy as np
@@ -24,11 +27,14 @@ LABEL_FILENAME = "selected_tags.csv"
 @dataclass
 class LabelData:
     names: list[str]
-    rating: list[np.int64]
-    general: list[np.int64]
-    character: list[np.int64]
+    rating: np.ndarray
+    general: np.ndarray
+    character: np.ndarray
 
 
+# Labels are kept across model unloads, so reloading an expired model
+# doesn't check the hub for the labels file and parse the CSV again
+@lru_cache(maxsize=8)
 def load_labels(model_repo: str):
     import huggingface_hub
 
@@ -42,9 +48,9 @@ def load_labels(model_repo: str):
     #     lambda x: x.replace("_", " ") if x not in kaomojis else x
     # )
     tag_names = name_series.tolist()
-    rating_indexes = list(np.where(dataframe["category"] == 9)[0])
-    general_indexes = list(np.where(dataframe["category"] == 0)[0])
-    character_indexes = list(np.where(dataframe["category"] == 4)[0])
+    rating_indexes = np.where(dataframe["category"] == 9)[0]
+    general_indexes = np.where(dataframe["category"] == 0)[0]
+    character_indexes = np.where(dataframe["category"] == 4)[0]
     tag_data = LabelData(
         names=tag_names,
         rating=rating_indexes,
@@ -54,6 +60,22 @@ def load_labels(model_repo: str):
     return tag_data
 
 
+def decode_image(
+    file: bytes, size: tuple[int, int] | None = None
+) -> PILImage.Image:
+    image = PILImage.open(BytesIO(file))
+    if size is not None:
+        # Let libjpeg decode JPEGs at a reduced scale (no effect on other
+        # formats). Both sides stay at least as large as the model input,
+        # which the image gets downscaled to anyway
+        image.draft("RGB", size)
+    if image.mode != "RGB":
+        return image.convert("RGB")
+    # convert() would return a full copy of an image that is already RGB
+    image.load()
+    return image
+
+
 import logging
 
 logger = logging.getLogger(__name__)
@@ -83,15 +105,25 @@ class WDTagger(InferenceModel):
         ).eval()
         state_dict = timm.models.load_state_dict_from_hf(self.model_repo)
         model.load_state_dict(state_dict)
-        transform = create_transform(
-            **resolve_data_config(model.pretrained_cfg, model=model)
+        transform_config = resolve_data_config(
+            model.pretrained_cfg, model=model
         )
+        transform = create_transform(**transform_config)
         assert not isinstance(transform, tuple), "Multiple preprocess functions"
         self.transform = transform
+        # Smallest image size the transform resizes to before cropping
+        _, height, width = transform_config["input_size"]
+        crop_pct = transform_config.get("crop_pct") or 1.0
+        self.input_size = (ceil(width / crop_pct), ceil(height / crop_pct))
 
         self.model = model
         self.devices = get_device()
         self.model.to(self.devices[0])
+        # Half precision on GPU, like the OCR model. The sigmoid is still
+        # computed in float32 so thresholds behave the same
+        self.half_precision = self.devices[0].type == "cuda"
+        if self.half_precision:
+            self.model.half()
         self._model_loaded = True
         logger.debug(f"Model {self.model_repo} loaded")
 
@@ -111,22 +143,30 @@ class WDTagger(InferenceModel):
     def prepare_images(self, images: Sequence[Image.Image]):
         import torch
 
-        batch = [self.prepare_image(image) for image in images]
+        # PIL and torchvision release the GIL while resizing,
+        # so the batch is preprocessed in parallel
+        with ThreadPoolExecutor() as executor:
+            batch = list(executor.map(self.prepare_image, images))
         return torch.cat(batch, dim=0)
 
     def predict(self, inputs: Sequence[PredictionInput]) -> List[dict]:
         self.load()
-        image_inputs: List[PILImage.Image] = []
+        files: List[bytes] = []
         configs: List[dict] = [inp.data for inp in inputs]  # type: ignore
         for input_item in inputs:
             if input_item.file:
-                image: PILImage.Image = PILImage.open(
-                    BytesIO(input_item.file)
-                ).convert("RGB")
-                image_inputs.append(image)
+                files.append(input_item.file)
             else:
                 raise ValueError("Tagger requires image inputs.")
 
+        # Decode the whole batch in parallel, PIL releases the GIL while decoding
+        with ThreadPoolExecutor() as executor:
+            image_inputs: List[PILImage.Image] = list(
+                executor.map(
+                    partial(decode_image, size=self.input_size), files
+                )
+            )
+
         logger.debug(f"Running inference on {len(image_inputs)} images")
 
         prob_list = self.run_batch(image_inputs, 0)
@@ -176,11 +216,13 @@ class WDTagger(InferenceModel):
             # move model to GPU, if available
             if self.devices[dev_idx].type != "cpu":
                 image_inputs = image_inputs.to(self.devices[dev_idx])
+            if self.half_precision:
+                image_inputs = image_inputs.half()
             # run the model
             outputs = self.model.forward(image_inputs)
             # apply the final activation function
             # (timm doesn't support doing this internally)
-            outputs = F.sigmoid(outputs)
+            outputs = F.sigmoid(outputs.float())
             # move inputs, outputs, and model back to to cpu if we were on GPU
             if self.devices[dev_idx].type != "cpu":
                 image_inputs = image_inputs.cpu()
@@ -197,55 +239,47 @@ class WDTagger(InferenceModel):
         if self.labels is None:
             raise ValueError("Labels not loaded")
 
-        # Convert indices+probs to labels
-        labels = list(zip(self.labels.names, probs.numpy()))
+        names = self.labels.names
+        probs = probs.numpy()
 
         # First 4 labels_data are actually ratings
-        rating_labels_all = [labels[i] for i in self.labels.rating]
-        rating_labels = dict(
-            [(label, float(probs)) for label, probs in rating_labels_all]
-        )
+        rating_labels = {
+            names[i]: float(probs[i]) for i in self.labels.rating
+        }
         # General labels, pick any where prediction confidence > threshold
-        general_labels_all = [labels[i] for i in self.labels.general]
-
-        general_probs = np.array([x[1] for x in general_labels_all])
+        general_probs = probs[self.labels.general]
         general_mcut = mcut_threshold(general_probs)
 
         if not general_thresh:
             # Use MCut thresholding
             general_thresh = general_mcut
 
-        general_labels = dict(
-            [
-                (label, float(probs))
-                for label, probs in general_labels_all
-                if probs > general_thresh
-            ]
-        )
-
-        character_labels_all = [labels[i] for i in self.labels.character]
-
-        character_probs = np.array([x[1] for x in character_labels_all])
-        character_mcut = mcut_threshold(character_probs)
+        # Only the labels above the threshold are converted to Python objects
+        general_labels = {
+            names[i]: float(probs[i])
+            for i in self.labels.general[general_probs > general_thresh]
+        }
 
+        character_probs = probs[self.labels.character]
+        # Unlike the general mcut, the character mcut is not returned
+        # to the caller, so it is only computed when it's used
+        character_mcut = None
         if not character_thresh:
             # Use MCut thresholding
+            character_mcut = float(mcut_threshold(character_probs))
             character_thresh = max(0.05, character_mcut)
 
         # Character labels, pick any where prediction confidence > threshold
-        character_labels = dict(
-            [
-                (label, float(probs))
-                for label, probs in character_labels_all
-                if probs > character_thresh
-            ]
-        )
+        character_labels = {
+            names[i]: float(probs[i])
+            for i in self.labels.character[character_probs > character_thresh]
+        }
 
         return TagResult(
             rating=rating_labels,
             character=character_labels,
             general=general_labels,
-            character_mcut=float(character_mcut),  # Ensure Python float
+            character_mcut=character_mcut,
             general_mcut=float(general_mcut),      # Ensure Python float
         )
 
@@ -265,7 +299,7 @@ class TagResult:
     rating: Dict[str, float]
     character: Dict[str, float]
     general: Dict[str, float]
-    character_mcut: float
+    character_mcut: float | None
     general_mcut: float
 
 
@@ -285,8 +285,10 @@ def get_metadata() -> Dict[str, Dict[str, Any]]:
     return ModelRegistry().list_inference_ids()
 
 
+# Not a coroutine, so repeat_every runs it in the threadpool:
+# unloading a model can block for seconds and would stall the event loop
 @repeat_every(seconds=10, logger=logger)
-async def check_ttl():
+def check_ttl():
     """Check the TTL of all loaded models and unload expired ones.
     Should be called periodically to ensure that models are not kept in memory indefinitely.
     """
@@ -7,6 +7,7 @@ from typing import Any, Dict, List
 
 import httpx
 from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
 from fastapi_utilities.repeat.repeat_at import repeat_at
 from pydantic import BaseModel
 from pydantic.dataclasses import dataclass
@@ -31,10 +32,13 @@ from panoptikon.db.files import (
     get_item_metadata_by_sha256,
 )
 from panoptikon.utils import open_file, show_in_fm
-from searchui.router import get_routers
+from searchui.router import client_failed, client_ready, get_routers
 
 logger = logging.getLogger(__name__)
 
+# Seconds clients are asked to wait while the UI client is being built
+CLIENT_BUILD_RETRY_AFTER = 10
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -252,6 +256,26 @@ def get_app(hostname: str, port: int) -> FastAPI:
             if request.url.path.startswith("/api/inference"):
                 proxy_url = os.getenv("INFERENCE_API_URL")
                 timeout = None
+            # Exception handlers don't run for exceptions raised in
+            # middleware, so errors are returned as responses directly
+            elif client_failed.is_set():
+                return JSONResponse(
+                    status_code=503,
+                    content={
+                        "detail": "The UI client could not be fetched or "
+                        "built, check the server logs"
+                    },
+                )
+            elif not client_ready.is_set():
+                # The client is still being fetched and built in the background
+                return JSONResponse(
+                    status_code=503,
+                    content={
+                        "detail": "The UI client is still being built, "
+                        "try again shortly"
+                    },
+                    headers={"Retry-After": str(CLIENT_BUILD_RETRY_AFTER)},
+                )
             # Otherwise, proxy the request to the Next.js frontend
             async with httpx.AsyncClient() as client:
                 try:
@@ -278,8 +302,9 @@ def get_app(hostname: str, port: int) -> FastAPI:
                     logger.error(
                         f"Error proxying request to {proxy_url}: {exc}"
                     )
-                    raise HTTPException(
-                        status_code=502, detail=f"Error proxying request: {exc}"
+                    return JSONResponse(
+                        status_code=502,
+                        content={"detail": f"Error proxying request: {exc}"},
                     )
 
             # Prepare headers by excluding certain problematic headers
@@ -82,19 +82,13 @@ def run_folder_update(conn_args: Dict[str, Any]):
 def rescan_folders(conn_args: Dict[str, Any]):
     from panoptikon.config import retrieve_system_config
 
-    with ensure_close(get_database_connection(**conn_args)) as conn:
-        system_config = retrieve_system_config(conn_args["index_db"])
-        resync_needed = is_resync_needed(conn, system_config)
-
-    if resync_needed:
-        logger.info("Resync needed, running folder update")
-        run_folder_update(conn_args)
-
     with ensure_close(get_database_connection(**conn_args)) as conn:
         system_config = retrieve_system_config(conn_args["index_db"])
         if is_resync_needed(conn, system_config):
             logger.info("Resync needed, running folder update")
             run_folder_update(conn_args)
+            # Folder paths are saved in the standard format by the update
+            system_config = retrieve_system_config(conn_args["index_db"])
 
         with atomic_transaction(conn, logger):
             ids, files_deleted, items_deleted, rule_files_deleted = (
@@ -115,10 +109,13 @@ def delete_model_data(
     model = ModelOptsFactory.get_model(inference_id)
     with ensure_close(get_database_connection(**conn_args)) as conn:
         logger.info(f"Running data deletion job for model {model}")
+        changes_before = conn.total_changes
         with atomic_transaction(conn, logger):
             report_str = model.delete_extracted_data(conn)
             logger.info(report_str)
-        vacuum_database(conn)
+        # Nothing to reclaim if the model had no data
+        if conn.total_changes > changes_before:
+            vacuum_database(conn)
         analyze_database(conn)
 
 
@@ -128,10 +125,12 @@ def delete_job_data(
 ):
     with ensure_close(get_database_connection(**conn_args)) as conn:
         logger.info(f"Running data deletion job log id {log_id}")
+        changes_before = conn.total_changes
         with atomic_transaction(conn, logger):
             delete_data_job_by_log_id(conn, log_id)
             logger.info(f"Deleted data for job log id {log_id}")
-        vacuum_database(conn)
+        if conn.total_changes > changes_before:
+            vacuum_database(conn)
         analyze_database(conn)
 
 def run_data_extraction_job(
@@ -141,18 +140,16 @@ def run_data_extraction_job(
     conn_args: Dict[str, Any],
 ):
     from panoptikon.config import retrieve_system_config
+    model = ModelOptsFactory.get_model(inference_id)
     with ensure_close(get_database_connection(**conn_args)) as conn:
         system_config = retrieve_system_config(conn_args["index_db"])
-        resync_needed = is_resync_needed(conn, system_config)
-
-    if resync_needed:
-        logger.info(
-            "Folders in config changed. Resync needed, running folder update"
-        )
-        run_folder_update(conn_args)
+        if is_resync_needed(conn, system_config):
+            logger.info(
+                "Folders in config changed. Resync needed, running folder update"
+            )
+            run_folder_update(conn_args)
+            system_config = retrieve_system_config(conn_args["index_db"])
 
-    model = ModelOptsFactory.get_model(inference_id)
-    with ensure_close(get_database_connection(**conn_args)) as conn:
         try:
             with atomic_transaction(conn, logger):
                 failed, images, videos, other, units = [], 0, 0, 0, 0
@@ -174,7 +171,6 @@ def run_data_extraction_job(
             end_time = datetime.datetime.now()
             total_time = end_time - start_time
             total_time_pretty = str(total_time).split(".")[0]
-            failed_str = ", ".join(failed)
             logger.info(
             f"""
             Extraction completed for model {model} in {total_time_pretty}.
@@ -185,7 +181,7 @@ def run_data_extraction_job(
             """
             )
             if len(failed) > 0:
-                logger.info(f"Failed files: {failed_str}")
+                logger.info(f"Failed files: {', '.join(failed)}")
             analyze_database(conn)
         except Exception as e:
             logger.error(
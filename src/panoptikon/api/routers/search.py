@@ -1,7 +1,10 @@
 import base64
 import io
 import logging
+import os
+import threading
 import time
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
@@ -11,7 +14,7 @@ from pydantic.dataclasses import dataclass
 
 from inferio.impl.utils import deserialize_array
 from panoptikon.api.routers.utils import get_db_readonly
-from panoptikon.db import get_database_connection
+from panoptikon.db import get_database_connection, get_db_paths
 from panoptikon.db.bookmarks import get_all_bookmark_namespaces
 from panoptikon.db.extracted_text import get_text_stats
 from panoptikon.db.extraction_log import get_existing_setters
@@ -70,9 +73,9 @@ def extract_embeddings(buffer: bytes) -> bytes:
     # Check the number of dimensions
     if len(numpy_array.shape) == 1:
         # If it is a 1D array, it is a single embedding
-        return serialize_f32(numpy_array.tolist())
+        return serialize_f32(numpy_array)
     # If it is a 2D array, it is a list of embeddings, get the first one
-    return serialize_f32(numpy_array[0].tolist())
+    return serialize_f32(numpy_array[0])
 
 
 class FileSearchResponse(BaseModel):
@@ -138,6 +141,78 @@ class APISearchStats:
     text_stats: ExtractedTextStats
 
 
+# The stats scan large tables, but only change when the databases are
+# written to, so they are reused while the database files are untouched.
+# Entries also expire after STATS_CACHE_TTL seconds in case a write
+# doesn't change a file's size or modification time.
+# The key includes the user parameter, so the cache is bounded
+# and least recently used entries are evicted
+STATS_CACHE_TTL = 60
+STATS_CACHE_SIZE = 16
+StatsCacheKey = Tuple[str, str, str, bool]
+stats_cache: OrderedDict[
+    StatsCacheKey, Tuple[Any, float, APISearchStats]
+] = OrderedDict()
+stats_cache_lock = threading.Lock()
+
+
+def remove_expired_stats(now: float):
+    expired = [
+        key
+        for key, (_, cached_time, _) in stats_cache.items()
+        if now - cached_time >= STATS_CACHE_TTL
+    ]
+    for key in expired:
+        del stats_cache[key]
+
+
+def get_cached_stats(
+    cache_key: StatsCacheKey, db_state: Any
+) -> APISearchStats | None:
+    with stats_cache_lock:
+        remove_expired_stats(time.monotonic())
+        cached = stats_cache.get(cache_key)
+        if cached is None:
+            return None
+        cached_state, _, stats = cached
+        if cached_state != db_state:
+            del stats_cache[cache_key]
+            return None
+        stats_cache.move_to_end(cache_key)
+        return stats
+
+
+def cache_stats(
+    cache_key: StatsCacheKey, db_state: Any, stats: APISearchStats
+):
+    with stats_cache_lock:
+        now = time.monotonic()
+        remove_expired_stats(now)
+        stats_cache[cache_key] = (db_state, now, stats)
+        stats_cache.move_to_end(cache_key)
+        while len(stats_cache) > STATS_CACHE_SIZE:
+            stats_cache.popitem(last=False)
+
+
+def get_db_files_state(index_db: str, user_data_db: str):
+    """
+    Size and modification time of the index and user data databases
+    and their write-ahead logs, which change whenever they are written to.
+    """
+    index_db_file, user_db_file, _ = get_db_paths(
+        index_db=index_db, user_data_db=user_data_db
+    )
+    state = []
+    for db_file in (index_db_file, user_db_file):
+        for path in (db_file, f"{db_file}-wal"):
+            try:
+                stat = os.stat(path)
+                state.append((stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                state.append(None)
+    return tuple(state)
+
+
 @router.get(
     "/stats",
     summary="Get statistics on the searchable data",
@@ -160,6 +235,18 @@ def get_stats(
         description="Include namespaces from bookmarks with the * user value",
     ),
 ):
+    cache_key = (
+        conn_args["index_db"],
+        conn_args["user_data_db"],
+        user,
+        include_wildcard,
+    )
+    db_state = get_db_files_state(
+        conn_args["index_db"], conn_args["user_data_db"]
+    )
+    if stats := get_cached_stats(cache_key, db_state):
+        return stats
+
     conn = get_database_connection(**conn_args)
     try:
         setters = get_existing_setters(conn)
@@ -172,7 +259,7 @@ def get_stats(
         min_tags_threshold = get_min_tag_confidence(conn)
         text_stats = get_text_stats(conn)
         files, items = get_file_stats(conn)
-        return APISearchStats(
+        stats = APISearchStats(
             setters=setters,
             bookmarks=bookmark_namespaces,
             files=FileStats(total=files, unique=items, mime_types=file_types),
@@ -183,6 +270,8 @@ def get_stats(
             folders=folders,
             text_stats=text_stats,
         )
+        cache_stats(cache_key, db_state, stats)
+        return stats
     finally:
         conn.close()
 
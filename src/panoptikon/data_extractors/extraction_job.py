@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
@@ -40,6 +42,9 @@ logger = logging.getLogger(__name__)
 R = TypeVar("R")
 I = TypeVar("I")
 
+# Minimum number of seconds between job log updates while a job is running
+PROGRESS_UPDATE_INTERVAL = 0.1
+
 
 def run_extraction_job(
     conn: sqlite3.Connection,
@@ -97,6 +102,8 @@ def run_extraction_job(
         0,
     )
     data_load_time, inference_time = 0.0, 0.0
+    setter_name = model_opts.setter_name()
+    last_progress_update, eta_str = 0.0, ""
     with atomic_transaction(conn, logger):
         job_id = add_data_log(
             conn,
@@ -172,25 +179,31 @@ def run_extraction_job(
             else:
                 other += 1
             total_items = remaining + processed_items
-            eta_str = estimate_eta(scan_time, processed_items, remaining)
+            now = time.monotonic()
+            # Fast extractors can process thousands of items per second,
+            # so only refresh the ETA and the job log periodically.
+            # The final counts are written once the loop is done.
+            if now - last_progress_update >= PROGRESS_UPDATE_INTERVAL:
+                last_progress_update = now
+                eta_str = estimate_eta(scan_time, processed_items, remaining)
+                update_log(
+                    conn,
+                    job_id,
+                    image_files=images,
+                    video_files=videos,
+                    other_files=other,
+                    total_segments=total_processed_units,
+                    errors=len(failed_items.keys()),
+                    total_remaining=remaining,
+                    data_load_time=data_load_time,
+                    inference_time=inference_time,
+                    finished=False,
+                )
             logger.info(
-                f"{model_opts.setter_name()}: ({processed_items}/{total_items}) "
+                f"{setter_name}: ({processed_items}/{total_items}) "
                 + f"(ETA: {eta_str}) "
                 + f"Processed ({item.type}) {item.path}"
             )
-            update_log(
-                conn,
-                job_id,
-                image_files=images,
-                video_files=videos,
-                other_files=other,
-                total_segments=total_processed_units,
-                errors=len(failed_items.keys()),
-                total_remaining=remaining,
-                data_load_time=data_load_time,
-                inference_time=inference_time,
-                finished=False,
-            )
             yield ExtractionJobProgress(
                 start_time, processed_items, total_items, eta_str, item, job_id
             )
@@ -240,8 +253,12 @@ def batch_items(
     """
     Process items in batches using the given
     item extractor and batch processing functions.
+    Inference on each batch runs in a background thread while the
+    next batch is loaded. Loading and output handling use the database
+    connection, so they stay on the calling thread.
     """
-    while True:
+
+    def load_batch():
         batch: List[Tuple[JobInputData, int]] = []
         work_units: List[I] = []
         batch_index_to_work_units: dict[int, List[int]] = {}
@@ -258,18 +275,43 @@ def batch_items(
             if len(work_units) >= batch_size:
                 # Stop adding items to the batch, and process
                 break
-        if len(work_units) == 0:
-            # No more work to do
-            break
-        processed_batch_items = minibatcher(
-            work_units, process_batch_func, batch_size
-        )
-        # Yield the batch and the processed items matching the work units to the batch item
-        for batch_index, wu_indices in batch_index_to_work_units.items():
-            item, remaining = batch[batch_index]
-            yield item, remaining, [work_units[i] for i in wu_indices], [
-                processed_batch_items[i] for i in wu_indices
-            ]
+        return batch, work_units, batch_index_to_work_units
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = None
+        while True:
+            batch, work_units, batch_index_to_work_units = load_batch()
+            future = None
+            if len(work_units) > 0:
+                future = executor.submit(
+                    minibatcher, work_units, process_batch_func, batch_size
+                )
+            if pending is not None:
+                yield from split_batch_results(*pending)
+            if future is None:
+                # No more work to do
+                break
+            pending = (
+                future,
+                batch,
+                work_units,
+                batch_index_to_work_units,
+            )
+
+
+def split_batch_results(
+    future: Future[List[R]],
+    batch: List[Tuple[JobInputData, int]],
+    work_units: List[I],
+    batch_index_to_work_units: dict[int, List[int]],
+):
+    processed_batch_items = future.result()
+    # Yield the batch and the processed items matching the work units to the batch item
+    for batch_index, wu_indices in batch_index_to_work_units.items():
+        item, remaining = batch[batch_index]
+        yield item, remaining, [work_units[i] for i in wu_indices], [
+            processed_batch_items[i] for i in wu_indices
+        ]
 
 
 def minibatcher(
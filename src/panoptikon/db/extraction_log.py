@@ -166,7 +166,12 @@ def get_all_data_logs(
             data_log.id,
             start_time,
             end_time,
-            COALESCE(COUNT(DISTINCT item_data.id), 0) AS distinct_item_count,
+            (
+                SELECT COUNT(*)
+                FROM item_data
+                WHERE item_data.job_id = data_log.job_id
+                AND item_data.is_placeholder = 0
+            ) AS distinct_item_count,
             type,
             setter,
             threshold,
@@ -186,16 +191,17 @@ def get_all_data_logs(
             END AS failed,
             data_log.completed,
             data_jobs.completed AS status
-        FROM data_log
-        LEFT JOIN item_data 
-            ON item_data.job_id = data_log.job_id
-            AND item_data.job_id IS NOT NULL
-            AND item_data.is_placeholder = 0
+        FROM (
+            -- Page the logs first, so items are only counted
+            -- for the logs that are returned
+            SELECT *
+            FROM data_log
+            ORDER BY start_time DESC, id DESC
+            {"LIMIT ? OFFSET ?" if page_size is not None else ""}
+        ) AS data_log
         LEFT JOIN data_jobs
             ON data_log.job_id = data_jobs.id
-        GROUP BY data_log.id
-        ORDER BY start_time DESC
-        {"LIMIT ? OFFSET ?" if page_size is not None else ""}
+        ORDER BY data_log.start_time DESC, data_log.id DESC
         """,
         (page_size, offset) if page_size is not None else (),
     )
@@ -395,7 +395,21 @@ def delete_items_without_files(
 
 def get_all_mime_types(conn: sqlite3.Connection) -> List[str]:
     cursor = conn.cursor()
-    cursor.execute("SELECT DISTINCT type FROM items")
+    # Equivalent to SELECT DISTINCT type FROM items, but jumps from one
+    # type to the next through the index on items.type instead of
+    # reading one index entry per item
+    cursor.execute(
+        """
+        WITH RECURSIVE types(type) AS (
+            SELECT MIN(type) FROM items
+            UNION ALL
+            SELECT (SELECT MIN(type) FROM items WHERE type > types.type)
+            FROM types
+            WHERE types.type IS NOT NULL
+        )
+        SELECT type FROM types WHERE type IS NOT NULL
+        """
+    )
     mime_types = [row[0] for row in cursor.fetchall()]
     general_types = set()
     for mime_type in mime_types:
@@ -458,15 +472,17 @@ def delete_files_not_allowed(conn: sqlite3.Connection, config: SystemConfig):
 
     assert result_count <= total_files, "Too many files violate the rules"
     logger.debug(f"{total_files} files in the database before deletion")
-    # Delete files that do not match the rules
-    for file in results_generator:
-        cursor.execute(
-            """
+    # Delete files that do not match the rules.
+    # The results are read in full first, then deleted in one executemany
+    files_to_delete = list(results_generator)
+    cursor.executemany(
+        """
         DELETE FROM files
         WHERE id = ?
         """,
-            (file.file_id,),
-        )
+        [(file.file_id,) for file in files_to_delete],
+    )
+    for file in files_to_delete:
         logger.debug(f"Deleted file {file.file_id} ({file.path})")
 
     cursor.execute("""SELECT COUNT(*) FROM files""")
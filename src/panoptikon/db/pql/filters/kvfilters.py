@@ -11,7 +11,15 @@ from typing import (
 )
 
 from pydantic import BaseModel, Field
-from sqlalchemy import CTE, ClauseElement, and_, not_, or_, select
+from sqlalchemy import (
+    CTE,
+    ClauseElement,
+    ColumnElement,
+    and_,
+    not_,
+    or_,
+    select,
+)
 from sqlalchemy.sql._typing import _ColumnExpressionArgument
 
 from panoptikon.db.pql.filters.filter import Filter
@@ -20,9 +28,9 @@ from panoptikon.db.pql.types import (
     ItemColumns,
     Operator,
     QueryState,
+    TEXT_COLUMNS,
     SearchResult,
     TextColumns,
-    contains_text_columns,
     get_column,
     get_std_cols,
 )
@@ -40,8 +48,13 @@ class MatchValuesBase(BaseModel):
             FieldValueType | List[FieldValueType],
         ]
     ]:
-        mdict = self.model_dump(exclude_unset=True)
-        return [(k, v) for k, v in mdict.items()]  # type: ignore
+        # Read the set fields directly instead of serializing the model.
+        # Walk them in declaration order so the generated SQL is stable
+        return [  # type: ignore
+            (k, getattr(self, k))
+            for k in type(self).model_fields
+            if k in self.model_fields_set
+        ]
 
 
 class MatchValues(MatchValuesBase):
@@ -122,6 +135,40 @@ operatorType = Literal[
 ]
 
 
+ExpressionBuilder = Callable[[Any, Any], ColumnElement]
+
+# Expression builders for each operator, keyed by operator name
+SCALAR_OPERATORS: Dict[str, ExpressionBuilder] = {
+    "eq": lambda col, v: col == v,
+    "neq": lambda col, v: col != v,
+    "startswith": lambda col, v: col.startswith(v),
+    "not_startswith": lambda col, v: not_(col.startswith(v)),
+    "endswith": lambda col, v: col.endswith(v),
+    "not_endswith": lambda col, v: not_(col.endswith(v)),
+    "contains": lambda col, v: col.contains(v),
+    "not_contains": lambda col, v: not_(col.contains(v)),
+    "gt": lambda col, v: col > v,
+    "gte": lambda col, v: col >= v,
+    "lt": lambda col, v: col < v,
+    "lte": lambda col, v: col <= v,
+}
+
+LIST_OPERATORS: Dict[str, ExpressionBuilder] = {
+    "eq": lambda col, v: col.in_(v),
+    "neq": lambda col, v: col.notin_(v),
+    "in_": lambda col, v: col.in_(v),
+    "nin": lambda col, v: col.notin_(v),
+    "startswith": lambda col, v: or_(*[col.startswith(x) for x in v]),
+    "not_startswith": lambda col, v: and_(
+        *[not_(col.startswith(x)) for x in v]
+    ),
+    "endswith": lambda col, v: or_(*[col.endswith(x) for x in v]),
+    "not_endswith": lambda col, v: and_(*[not_(col.endswith(x)) for x in v]),
+    "contains": lambda col, v: or_(*[col.contains(x) for x in v]),
+    "not_contains": lambda col, v: and_(*[not_(col.contains(x)) for x in v]),
+}
+
+
 class KVFilter(Filter):
     def build_multi_kv_query(
         self,
@@ -138,22 +185,7 @@ class KVFilter(Filter):
             setters,
         )
 
-        if not state.item_data_query:
-            return self.wrap_query(
-                select(*get_std_cols(context, state))
-                .join(
-                    items,
-                    items.c.id == context.c.item_id,
-                )
-                .join(
-                    files,
-                    files.c.id == context.c.file_id,
-                )
-                .where(criteria),
-                context,
-                state,
-            )
-        return self.wrap_query(
+        query = (
             select(*get_std_cols(context, state))
             .join(
                 items,
@@ -163,22 +195,23 @@ class KVFilter(Filter):
                 files,
                 files.c.id == context.c.file_id,
             )
-            .join(
-                extracted_text,
-                extracted_text.c.id == context.c.data_id,
-            )
-            .join(
-                item_data,
-                item_data.c.id == context.c.data_id,
-            )
-            .join(
-                setters,
-                setters.c.id == item_data.c.setter_id,
-            )
-            .where(criteria),
-            context,
-            state,
         )
+        if state.item_data_query:
+            query = (
+                query.join(
+                    extracted_text,
+                    extracted_text.c.id == context.c.data_id,
+                )
+                .join(
+                    item_data,
+                    item_data.c.id == context.c.data_id,
+                )
+                .join(
+                    setters,
+                    setters.c.id == item_data.c.setter_id,
+                )
+            )
+        return self.wrap_query(query.where(criteria), context, state)
 
 
 class MatchOps(BaseModel):
@@ -213,6 +246,15 @@ class MatchNot(BaseModel):
 Matches = Union[MatchOps, MatchAnd, MatchOr, MatchNot]
 
 
+def set_operators(match_ops: MatchOps) -> List[str]:
+    # Operators that were set, in declaration order
+    return [
+        operator
+        for operator in MatchOps.model_fields
+        if operator in match_ops.model_fields_set
+    ]
+
+
 class Match(KVFilter):
     match: Matches = Field(
         ...,
@@ -238,34 +280,16 @@ based on their type, size, or the path of the file they are associated with.
             """
             has_valid_condition = False
 
-            # Define all basic operators
-            basic_operators = [
-                "eq",
-                "neq",
-                "in_",
-                "nin",
-                "gt",
-                "gte",
-                "lt",
-                "lte",
-                "startswith",
-                "not_startswith",
-                "endswith",
-                "not_endswith",
-                "contains",
-                "not_contains",
-            ]
-
             # Clean basic operators
             if isinstance(match_ops, MatchOps):
-                for operator in basic_operators:
-                    args = getattr(match_ops, operator, None)
-                    if args is not None:
-                        if isinstance(args, MatchValuesBase):
-                            if len(args.get_set_values()) == 0:
-                                setattr(match_ops, operator, None)
-                            else:
-                                has_valid_condition = True
+                for operator in set_operators(match_ops):
+                    args = getattr(match_ops, operator)
+                    if args is None or not isinstance(args, MatchValuesBase):
+                        continue
+                    if len(args.model_fields_set) == 0:
+                        setattr(match_ops, operator, None)
+                    else:
+                        has_valid_condition = True
             if isinstance(match_ops, MatchAnd):
                 # Clean and_ operator
                 new_and = []
@@ -326,92 +350,27 @@ based on their type, size, or the path of the file they are associated with.
         assert isinstance(match_ops, MatchOps), "Invalid Matches type"
         # Handle basic operators
         basic_expressions = []
-        basic_operators = [
-            "eq",
-            "neq",
-            "in_",
-            "nin",
-            "gt",
-            "gte",
-            "lt",
-            "lte",
-            "startswith",
-            "not_startswith",
-            "endswith",
-            "not_endswith",
-            "contains",
-            "not_contains",
-        ]
-
-        for operator in basic_operators:
-            args = getattr(match_ops, operator, None)
-            if args:
-                assert isinstance(args, MatchValuesBase), "Invalid Args type"
-                for key, value in args.get_set_values():
-                    if not text_columns and contains_text_columns([key]):
-                        raise ValueError(
-                            "Text columns are not allowed in this context"
-                        )
-                    column = get_column(key)
-                    if not isinstance(value, list):
-                        if operator == "eq":
-                            expr = column == value
-                        elif operator == "neq":
-                            expr = column != value
-                        elif operator == "startswith":
-                            expr = column.startswith(value)
-                        elif operator == "not_startswith":
-                            expr = not_(column.startswith(value))
-                        elif operator == "endswith":
-                            expr = column.endswith(value)
-                        elif operator == "not_endswith":
-                            expr = not_(column.endswith(value))
-                        elif operator == "contains":
-                            expr = column.contains(value)
-                        elif operator == "not_contains":
-                            expr = not_(column.contains(value))
-                        elif operator == "gt":
-                            expr = column > value
-                        elif operator == "gte":
-                            expr = column >= value
-                        elif operator == "lt":
-                            expr = column < value
-                        elif operator == "lte":
-                            expr = column <= value
-                        else:
-                            raise ValueError("Invalid operator")
-                        basic_expressions.append(expr)
-                    else:
-                        # List values
-                        if operator == "eq":
-                            expr = column.in_(value)
-                        elif operator == "neq":
-                            expr = column.notin_(value)
-                        elif operator == "in_":
-                            expr = column.in_(value)
-                        elif operator == "nin":
-                            expr = column.notin_(value)
-                        elif operator == "startswith":
-                            expr = or_(*[column.startswith(v) for v in value])
-                        elif operator == "not_startswith":
-                            expr = and_(
-                                *[not_(column.startswith(v)) for v in value]
-                            )
-                        elif operator == "endswith":
-                            expr = or_(*[column.endswith(v) for v in value])
-                        elif operator == "not_endswith":
-                            expr = and_(
-                                *[not_(column.endswith(v)) for v in value]
-                            )
-                        elif operator == "contains":
-                            expr = or_(*[column.contains(v) for v in value])
-                        elif operator == "not_contains":
-                            expr = and_(
-                                *[not_(column.contains(v)) for v in value]
-                            )
-                        else:
-                            raise ValueError("Invalid operator for list values")
-                        basic_expressions.append(expr)
+        for operator in set_operators(match_ops):
+            args = getattr(match_ops, operator)
+            if args is None or not isinstance(args, MatchValuesBase):
+                continue
+            for key, value in args.get_set_values():
+                if not text_columns and key in TEXT_COLUMNS:
+                    raise ValueError(
+                        "Text columns are not allowed in this context"
+                    )
+                column = get_column(key)
+                if not isinstance(value, list):
+                    build_expr = SCALAR_OPERATORS.get(operator)
+                    if build_expr is None:
+                        raise ValueError("Invalid operator")
+                    basic_expressions.append(build_expr(column, value))
+                else:
+                    # List values
+                    build_expr = LIST_OPERATORS.get(operator)
+                    if build_expr is None:
+                        raise ValueError("Invalid operator for list values")
+                    basic_expressions.append(build_expr(column, value))
 
         if basic_expressions:
             return and_(*basic_expressions)
@@ -1,10 +1,8 @@
 import io
 import logging
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, Literal, Optional
 
 import numpy as np
-import PIL
-import PIL.Image
 from pydantic import BaseModel, Field, PrivateAttr
 from sqlalchemy import and_, func, literal, literal_column, not_, or_
 from sqlalchemy.sql.expression import CTE, select
@@ -27,6 +25,9 @@ from panoptikon.db.pql.types import (
 )
 from panoptikon.db.utils import serialize_f32
 
+if TYPE_CHECKING:
+    import PIL.Image
+
 logger = logging.getLogger(__name__)
 
 
@@ -316,7 +317,7 @@ Search for image using semantic search on image embeddings.
 
 
 def get_clip_embed(
-    input: str | PIL.Image.Image,
+    input: "str | PIL.Image.Image",
     model_name: str,
     embed_args: EmbedArgs,
 ):
@@ -334,8 +335,7 @@ def get_clip_embed(
         )[0]
         embed = deserialize_array(embed_bytes)
         assert isinstance(embed, np.ndarray)
-        embed_list: List[float] = embed.tolist() # type: ignore
-        return serialize_f32(embed_list)
+        return serialize_f32(embed)
     else:  # input is an image
         # Save image into a buffer
         image_buffer = io.BytesIO()
@@ -350,5 +350,4 @@ def get_clip_embed(
         )[0]
         embed = deserialize_array(embed_bytes)
         assert isinstance(embed, np.ndarray)
-        embed_list: List[float] = embed.tolist() # type: ignore
-        return serialize_f32(embed_list)
\ No newline at end of file
+        return serialize_f32(embed)
\ No newline at end of file
@@ -2,7 +2,7 @@ import logging
 from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field, PrivateAttr
-from sqlalchemy import and_, func, not_, or_
+from sqlalchemy import and_, func, not_, or_, true
 from sqlalchemy.sql.expression import CTE, select
 
 from panoptikon.db.pql.filters.sortable.utils import get_distance_func_override
@@ -367,8 +367,15 @@ Restricting similarity to a tagger model or a set of tagger models
             f"unqemb_{self.get_cte_name(state.cte_counter)}"
         )
 
-        # For the target item
-        main_embeddings = unqemb_cte.alias("main_embeddings")
+        # For the target item, materialized once so that each candidate
+        # is only paired with the target's few embeddings
+        main_embeddings = (
+            select(unqemb_cte)
+            .where(unqemb_cte.c.sha256 == args.target)
+            .cte(f"trgemb_{self.get_cte_name(state.cte_counter)}")
+            .prefix_with("MATERIALIZED")
+            .alias("main_embeddings")
+        )
         # For the items to compare against
         other_embeddings = unqemb_cte.alias("other_embeddings")
 
@@ -430,23 +437,27 @@ Restricting similarity to a tagger model or a set of tagger models
                 *get_std_cols(other_embeddings, state),
             )
             .select_from(other_embeddings)
-            .join(
-                main_embeddings,
-                main_embeddings.c.sha256 == args.target,
-            )
+            .join(main_embeddings, true())
             .where(other_embeddings.c.sha256 != args.target)
             .group_by(*get_std_group_by(other_embeddings, state))
         )
         if args.clip_xmodal:
             # If using cross-modal similarity, we can restrict the distance calculation
             # to only the relevant types of embeddings
-            if not args.xmodal_i2i:
+            if not args.xmodal_i2i and not args.xmodal_t2t:
+                # Only image-to-text similarity, a single comparison per pair
+                # since the embeddings are either "clip" or "text-embedding"
+                distance_select = distance_select.where(
+                    main_embeddings.c.data_type
+                    != other_embeddings.c.data_type
+                )
+            elif not args.xmodal_i2i:
                 # Disallow image-to-image similarity
                 distance_select = distance_select.where(
                     (main_embeddings.c.data_type != "clip")
                     | (other_embeddings.c.data_type != "clip")
                 )
-            if not args.xmodal_t2t:
+            elif not args.xmodal_t2t:
                 # Disallow text-to-text similarity
                 distance_select = distance_select.where(
                     (main_embeddings.c.data_type != "text-embedding")
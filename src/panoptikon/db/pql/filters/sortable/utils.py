@@ -21,11 +21,9 @@ def extract_embeddings(buffer: str) -> bytes:
     # Check the number of dimensions
     if len(numpy_array.shape) == 1:
         # If it is a 1D array, it is a single embedding
-        array_list = numpy_array.tolist()
-        assert isinstance(array_list, list), "Expected a list"
-        return serialize_f32(array_list)
+        return serialize_f32(numpy_array)
     # If it is a 2D array, it is a list of embeddings, get the first one
-    return serialize_f32(numpy_array[0].tolist())
+    return serialize_f32(numpy_array[0])
 
 def get_distance_func_override(
         model_name: str,
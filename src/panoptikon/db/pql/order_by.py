@@ -73,6 +73,9 @@ def build_order_by(
 def combine_order_lists(
     order_list: List[OrderByFilter], order_args: List[OrderArgs]
 ) -> List[Union[OrderArgs, OrderByFilter, List[OrderByFilter]]]:
+    # Common case: a single ordering, nothing to sort or group
+    if len(order_list) + len(order_args) <= 1:
+        return [*order_list, *order_args]
 
     # order_list has priority over order_args by default
     combined = [(obj, idx, 0) for idx, obj in enumerate(order_list)] + [
@@ -244,15 +247,19 @@ def coalesce_order_filters(
             return direction(coalesced_column)  # type: ignore
 
         # If RRF is not enabled, pick the best value from the columns
+        # The sentinels are inlined as constants rather than bound once per
+        # column, so SQLite factors them out of the per-row evaluation
         # For ascending order, use MIN to get the smallest non-null value
         if direction == asc:
+            sentinel = literal_column(str(VERY_LARGE_NUMBER))
             coalesced_column = func.min(
-                *[func.coalesce(column, VERY_LARGE_NUMBER) for column in cols]
+                *[func.coalesce(column, sentinel) for column in cols]
             )
         # For descending order, use MAX to get the largest non-null value
         else:
+            sentinel = literal_column(str(VERY_SMALL_NUMBER))
             coalesced_column = func.max(
-                *[func.coalesce(column, VERY_SMALL_NUMBER) for column in cols]
+                *[func.coalesce(column, sentinel) for column in cols]
             )
         return direction(coalesced_column)
 
@@ -60,12 +60,12 @@ OrderType = Union[Literal["asc", "desc"], None]
 OrderTypeNN = Literal["asc", "desc"]
 
 
-def contains_text_columns(lst: Sequence[str]) -> bool:
-    # Get the allowed values from the Literal
-    literal_values = set(get_args(TextColumns))
+TEXT_COLUMNS = frozenset(get_args(TextColumns))
+
 
-    # Check if there's any intersection between the list and the literal values
-    return bool(set(lst) & literal_values)
+def contains_text_columns(lst: Sequence[str]) -> bool:
+    # Check if there's any intersection between the list and the text columns
+    return not TEXT_COLUMNS.isdisjoint(lst)
 
 
 class RRF(BaseModel):
@@ -1,5 +1,5 @@
 import sqlite3
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from panoptikon.db.tagstats import get_tag_frequency_by_ids
 
@@ -69,6 +69,46 @@ def add_tag_to_item(
     insert_tag_item(conn, data_id, tag_id, confidence)
 
 
+def add_tags_to_item(
+    conn: sqlite3.Connection,
+    data_id: int,
+    tags: Sequence[Tuple[str, str, float]],
+):
+    """
+    Same as calling add_tag_to_item for each (namespace, name, confidence),
+    but with one executemany per table instead of several statements per tag.
+    """
+    if not tags:
+        return
+    cursor = conn.cursor()
+    cursor.executemany(
+        """
+    INSERT INTO tags (namespace, name)
+    VALUES (?, ?)
+    ON CONFLICT(namespace, name) DO NOTHING
+    """,
+        [(namespace, name) for namespace, name, _ in tags],
+    )
+    cursor.executemany(
+        """
+        INSERT INTO tags_items
+        (item_data_id, tag_id, confidence)
+        SELECT item_data.id, tags.id, ?
+        FROM item_data, tags
+        WHERE item_data.id = ?
+        AND item_data.data_type = 'tags'
+        AND tags.namespace = ?
+        AND tags.name = ?
+        """,
+        [
+            # Round confidence to 4 decimal places
+            (round(float(confidence), 4), data_id, namespace, name)
+            for namespace, name, confidence in tags
+        ],
+    )
+    assert cursor.rowcount == len(tags), "Not all tag items were inserted"
+
+
 def delete_orphan_tags(conn: sqlite3.Connection):
     cursor = conn.cursor()
     cursor.execute(
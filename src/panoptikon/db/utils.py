@@ -1,8 +1,9 @@
 import logging
 import sqlite3
-import struct
 from typing import List
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,6 +77,9 @@ def pretty_print_SQL(query_str: str, params: List[str | float | int]):
         logger.error(query_str, params)
 
 
-def serialize_f32(vector: List[float]) -> bytes:
-    """serializes a list of floats into a compact "raw bytes" format"""
-    return struct.pack("%sf" % len(vector), *vector)
+def serialize_f32(vector: List[float] | np.ndarray) -> bytes:
+    """
+    serializes a list or array of floats into a compact "raw bytes" format.
+    Arrays are written directly, without a round trip through a Python list
+    """
+    return np.asarray(vector, dtype=np.float32).tobytes()
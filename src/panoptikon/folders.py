@@ -70,8 +70,9 @@ def execute_folder_scan(
         included_folders = all_included_folders
 
     # Ensure that all included_folders are also marked as included in the database
+    included_set = set(all_included_folders)
     included_folders = [
-        folder for folder in included_folders if folder in all_included_folders
+        folder for folder in included_folders if folder in included_set
     ]
     # Ensure that all included_folders are valid
     included_folders = [
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import os
 import shutil
@@ -12,9 +13,16 @@ from nodejs_wheel import npm, npx
 
 logger = logging.getLogger(__name__)
 
+# Set once the Node.js client server is being started
+client_ready = threading.Event()
+# Set if the client could not be fetched or built, and will not start
+client_failed = threading.Event()
+
 
 def get_client_url(parent_hostname: str) -> str:
     if url := os.getenv("CLIENT_URL"):
+        # The client is managed externally
+        client_ready.set()
         return url
     else:
         client_hostname = os.getenv("CLIENT_HOST", parent_hostname)
@@ -55,6 +63,24 @@ REPO_URL = "https://github.com/reasv/panoptikon-ui.git"
 
 
 def run_node_client(hostname: str, port: int):
+    # Fetching and building the client can take minutes,
+    # so it runs in the background instead of blocking the API startup
+    client_thread = threading.Thread(
+        target=client_thread_main, args=(hostname, port)
+    )
+    client_thread.start()
+
+
+def client_thread_main(hostname: str, port: int):
+    try:
+        build_and_run_node_client(hostname, port)
+    except Exception as e:
+        logger.error(f"Failed to run the Node.js client: {e}", exc_info=True)
+        if not client_ready.is_set():
+            client_failed.set()
+
+
+def build_and_run_node_client(hostname: str, port: int):
     logger.info("Running Node.js client")
 
     client_dir = os.path.join(os.path.dirname(__file__), "panoptikon-ui")
@@ -72,31 +98,50 @@ def run_node_client(hostname: str, port: int):
             logger.error(f"Do you have an internet connection?")
             # Check if the directory exists and is not empty
             if not os.path.exists(client_dir) or not os.listdir(client_dir):
-                logger.error("The client UI directory is empty. Exiting...")
+                logger.error(
+                    "The client UI directory is empty. The UI will not be available."
+                )
                 logger.error(
                     "If you want to disable the UI client, set ENABLE_CLIENT=false in the environment."
                 )
                 raise e
+            client_failed.set()
             return
         # Check if build is needed based on the latest commit timestamp
         if is_build_needed(build_dir, client_dir):
             logger.info("Building the Next.js application...")
             # Install dependencies
             delete_build_directory(build_dir)
-            npm(
-                ["install", "--include=dev"],
-                cwd=client_dir,
-                stdout=subprocess.DEVNULL,
-            )
-            npx(
+            # Only install when package-lock.json changed since the last install
+            lockfile_hash = get_lockfile_hash(client_dir)
+            if lockfile_hash and lockfile_hash == get_installed_hash(
+                client_dir
+            ):
+                logger.info("Dependencies are up to date. Skipping install.")
+            else:
+                install_result = npm(
+                    ["install", "--include=dev"],
+                    cwd=client_dir,
+                    stdout=subprocess.DEVNULL,
+                )
+                if install_result != 0:
+                    logger.warning(
+                        f"npm install exited with code {install_result}"
+                    )
+                # npm install may rewrite the lockfile, so hash it again
+                elif installed_hash := get_lockfile_hash(client_dir):
+                    write_installed_hash(client_dir, installed_hash)
+            build_result = npx(
                 ["--yes", "next", "build"],
                 cwd=client_dir,
                 # stdout=subprocess.DEVNULL,
             )
+            if build_result == 0:
+                write_built_commit(build_dir, get_head_commit(client_dir))
         else:
             logger.info("Build is up to date. Skipping build step.")
 
-    # Function to start the server in a separate thread
+    # Function to start the server, blocks for as long as the server runs
     def start_server():
         logger.info("Starting the Node.js client server...")
         if public_api := os.getenv("PANOPTIKON_API_URL"):
@@ -112,11 +157,10 @@ def run_node_client(hostname: str, port: int):
             **other_values
         )
 
-    # Start the server in a new thread
-    server_thread = threading.Thread(target=start_server)
-    server_thread.start()
-
-    logger.info(f"Node.js client started on {hostname}:{port}")
+    logger.info(f"Node.js client starting on {hostname}:{port}")
+    client_ready.set()
+    # Already running in the client thread
+    start_server()
 
 
 def delete_build_directory(build_dir):
@@ -128,41 +172,86 @@ def delete_build_directory(build_dir):
         shutil.rmtree(build_dir)
 
 
-def get_latest_commit_timestamp(repo_dir):
+BUILT_COMMIT_FILE = ".built_commit"
+
+
+def get_head_commit(repo_dir):
     """
-    Get the timestamp of the latest commit in the Git repository.
+    Get the hash of the current commit in the Git repository.
     """
     result = subprocess.run(
-        ["git", "-C", repo_dir, "log", "-1", "--format=%ct"],
+        ["git", "-C", repo_dir, "rev-parse", "HEAD"],
         capture_output=True,
         text=True,
         check=True,
     )
-    return int(result.stdout.strip())
+    return result.stdout.strip()
 
 
-def get_build_timestamp(build_dir):
+def get_built_commit(build_dir):
     """
-    Get the modification time of the build directory.
-    Returns None if the directory does not exist.
+    Get the hash of the commit the build directory was built from.
+    Returns None if there is no build, or it was not recorded.
     """
-    if not os.path.exists(build_dir):
+    try:
+        with open(os.path.join(build_dir, BUILT_COMMIT_FILE)) as f:
+            return f.read().strip()
+    except OSError:
         return None
-    # Get the latest modification time of the .next directory
-    return int(os.path.getmtime(build_dir))
+
+
+def write_built_commit(build_dir, commit):
+    """
+    Record the commit the build directory was built from.
+    """
+    with open(os.path.join(build_dir, BUILT_COMMIT_FILE), "w") as f:
+        f.write(commit)
+
+
+INSTALLED_HASH_FILE = os.path.join("node_modules", ".install_hash")
+
+
+def get_lockfile_hash(repo_dir):
+    """
+    Get the sha256 of package-lock.json, or None if there is no lockfile.
+    """
+    try:
+        with open(os.path.join(repo_dir, "package-lock.json"), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def get_installed_hash(repo_dir):
+    """
+    Get the lockfile hash node_modules was last installed from.
+    Returns None if there are no dependencies installed, or it was not recorded.
+    """
+    try:
+        with open(os.path.join(repo_dir, INSTALLED_HASH_FILE)) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def write_installed_hash(repo_dir, lockfile_hash):
+    """
+    Record the lockfile hash node_modules was installed from.
+    """
+    with open(os.path.join(repo_dir, INSTALLED_HASH_FILE), "w") as f:
+        f.write(lockfile_hash)
 
 
 def is_build_needed(build_dir, repo_dir):
     """
-    Determine if a build is needed by comparing the latest commit timestamp with the build directory timestamp.
+    Determine if a build is needed by comparing the current commit with the commit the build was made from.
     """
-    latest_commit_timestamp = get_latest_commit_timestamp(repo_dir)
-    build_timestamp = get_build_timestamp(build_dir)
+    # If there is no recorded build or the repository has moved since, we need to rebuild
+    return get_built_commit(build_dir) != get_head_commit(repo_dir)
+
 
-    # If build directory doesn't exist or if the latest commit is newer than the build, we need to rebuild
-    if build_timestamp is None or latest_commit_timestamp > build_timestamp:
-        return True
-    return False
+# Seconds to wait for `git pull` before falling back to the existing checkout
+PULL_TIMEOUT = 30
 
 
 def fetch_or_pull_repo(repo_url, repo_dir):
@@ -178,8 +267,14 @@ def fetch_or_pull_repo(repo_url, repo_dir):
         )
     else:
         logger.info("Repository already exists. Pulling the latest changes...")
-        subprocess.run(
-            ["git", "-C", repo_dir, "pull"],
-            check=True,
-            stdout=subprocess.DEVNULL,
-        )
+        try:
+            subprocess.run(
+                ["git", "-C", repo_dir, "pull"],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                timeout=PULL_TIMEOUT,
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            # Not fatal, the existing checkout (and build) can still be served
+            logger.warning(f"Failed to pull the UI repository: {e}")
+            logger.warning("Using the existing copy of the client")
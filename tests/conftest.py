@@ -0,0 +1,16 @@
+import pytest
+
+from panoptikon.db import get_database_connection, run_migrations
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    """Write connection to a freshly migrated index database"""
+    monkeypatch.setenv("DATA_FOLDER", str(tmp_path))
+    monkeypatch.setenv("READONLY", "false")
+    monkeypatch.delenv("INDEX_DB", raising=False)
+    monkeypatch.delenv("USER_DATA_DB", raising=False)
+    run_migrations()
+    conn = get_database_connection(write_lock=True)
+    yield conn
+    conn.close()
@@ -0,0 +1,83 @@
+import threading
+
+from panoptikon.data_extractors.extraction_job import batch_items
+
+# Number of work units produced by each item, including items that produce
+# none, in the middle of a batch and at the end of the input
+WORK_UNITS = [2, 0, 3, 1, 1, 4, 0, 2, 0]
+
+
+def items_generator():
+    for index in range(len(WORK_UNITS)):
+        yield index, len(WORK_UNITS) - index - 1
+
+
+def transform(item):
+    return [f"{item}:{n}" for n in range(WORK_UNITS[item])]
+
+
+def test_batch_items_matches_sequential_batching():
+    calls = []
+
+    def process(batch):
+        calls.append(list(batch))
+        return [f"out {wu}" for wu in batch]
+
+    results = list(batch_items(items_generator(), 3, transform, process))
+
+    # Same output and grouping as the sequential implementation
+    assert results == [
+        (0, 8, ["0:0", "0:1"], ["out 0:0", "out 0:1"]),
+        (1, 7, [], []),
+        (2, 6, ["2:0", "2:1", "2:2"], ["out 2:0", "out 2:1", "out 2:2"]),
+        (3, 5, ["3:0"], ["out 3:0"]),
+        (4, 4, ["4:0"], ["out 4:0"]),
+        (
+            5,
+            3,
+            ["5:0", "5:1", "5:2", "5:3"],
+            ["out 5:0", "out 5:1", "out 5:2", "out 5:3"],
+        ),
+        (6, 2, [], []),
+        (7, 1, ["7:0", "7:1"], ["out 7:0", "out 7:1"]),
+        (8, 0, [], []),
+    ]
+    # Batches are split into minibatches of at most batch_size
+    assert calls == [
+        ["0:0", "0:1", "2:0"],
+        ["2:1", "2:2"],
+        ["3:0", "4:0", "5:0"],
+        ["5:1", "5:2", "5:3"],
+        ["7:0", "7:1"],
+    ]
+
+
+def test_batch_items_loads_next_batch_during_inference():
+    second_batch_loaded = threading.Event()
+    overlapped = []
+
+    def transform_and_signal(item):
+        if item == 2:
+            second_batch_loaded.set()
+        return transform(item)
+
+    def process(batch):
+        if batch[0] == "0:0":
+            # The first batch's inference waits for the next batch to load
+            overlapped.append(second_batch_loaded.wait(timeout=5))
+        return batch
+
+    results = list(
+        batch_items(items_generator(), 2, transform_and_signal, process)
+    )
+
+    assert overlapped == [True]
+    # Items without work units after the last full batch are not yielded
+    assert [item for item, _, _, _ in results] == list(range(8))
+
+
+def test_batch_items_without_work_units():
+    def process(batch):
+        raise AssertionError("Nothing to process")
+
+    assert list(batch_items(iter([(0, 0)]), 2, lambda _: [], process)) == []
@@ -0,0 +1,34 @@
+# panoptikon.db.extraction_log is part of an import cycle that only
+# resolves when entered through the data extractors
+import panoptikon.data_extractors  # noqa: F401 isort: skip
+from panoptikon.db.extraction_log import get_all_data_logs
+
+
+def add_logs(conn, count: int):
+    conn.executemany(
+        """
+        INSERT INTO data_log (
+            id, start_time, end_time, type, setter, batch_size,
+            image_files, video_files, other_files, total_segments,
+            errors, total_remaining, data_load_time, inference_time,
+            completed
+        )
+        VALUES (?, ?, '', 'tags', 'tagger', 1, 0, 0, 0, 0, 0, 0, 0, 0, 1)
+        """,
+        # Several logs share each start time
+        [(i, f"2024-01-0{i % 3 + 1}T00:00:00") for i in range(1, count + 1)],
+    )
+
+
+def test_data_log_pages_are_deterministic(conn):
+    add_logs(conn, 30)
+    all_logs = [log.id for log in get_all_data_logs(conn)]
+    paged_logs = [
+        log.id
+        for page in range(1, 7)
+        for log in get_all_data_logs(conn, page=page, page_size=5)
+    ]
+
+    assert paged_logs == all_logs
+    # Newest first, ties broken by the most recent log id
+    assert all_logs[:4] == [29, 26, 23, 20]
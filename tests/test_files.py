@@ -0,0 +1,47 @@
+# panoptikon.db.files is part of an import cycle that only resolves when
+# entered through the data extractors
+import panoptikon.data_extractors  # noqa: F401 isort: skip
+from panoptikon.db.files import get_all_mime_types
+
+MIME_TYPES = [
+    "image/png",
+    "image/jpeg",
+    "video/mp4",
+    "image/png",
+    "application/pdf",
+    "video/mp4",
+    "image/png",
+]
+
+
+def add_items(conn, mime_types):
+    conn.executemany(
+        """
+        INSERT INTO items (sha256, md5, type, time_added)
+        VALUES (?, 'md5', ?, '2024-01-01T00:00:00')
+        """,
+        [(f"sha256-{i}", mime) for i, mime in enumerate(mime_types)],
+    )
+
+
+def test_get_all_mime_types_matches_distinct(conn):
+    add_items(conn, MIME_TYPES)
+    distinct = [
+        row[0] for row in conn.execute("SELECT DISTINCT type FROM items")
+    ]
+    general = {mime.split("/")[0] + "/" for mime in distinct}
+
+    assert get_all_mime_types(conn) == sorted(distinct + list(general))
+    assert get_all_mime_types(conn) == [
+        "application/",
+        "application/pdf",
+        "image/",
+        "image/jpeg",
+        "image/png",
+        "video/",
+        "video/mp4",
+    ]
+
+
+def test_get_all_mime_types_empty(conn):
+    assert get_all_mime_types(conn) == []
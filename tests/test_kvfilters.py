@@ -0,0 +1,33 @@
+# The PQL filters are part of an import cycle that only resolves when
+# entered through the data extractors
+import panoptikon.data_extractors  # noqa: F401 isort: skip
+from panoptikon.db.pql.pql_model import PQLQuery
+from panoptikon.db.pql.query_builder import build_query
+from panoptikon.db.pql.search import get_sql
+
+
+def get_where_clause(conn, match: dict) -> str:
+    query = PQLQuery(query={"match": match})  # type: ignore
+    stmt, _ = build_query(query, count_query=False)
+    sql, params = get_sql(stmt)
+    conn.execute(sql, params).fetchall()
+    return sql.split("WHERE", 1)[1].split("ORDER BY", 1)[0].strip()
+
+
+def test_match_clauses_follow_declaration_order(conn):
+    # Operators and fields are given out of declaration order
+    where = get_where_clause(
+        conn,
+        {
+            "lt": {"duration": 4.0},
+            "startswith": {"path": ["/a", "/b"], "filename": "x"},
+            "gt": {"height": 3, "size": 1, "width": 2},
+            "eq": {"type": "image/png"},
+        },
+    )
+    assert where == (
+        "items.type = ? AND items.size > ? AND items.width > ? "
+        "AND items.height > ? AND items.duration < ? "
+        "AND ((files.path LIKE ? || '%') OR (files.path LIKE ? || '%')) "
+        "AND (files.filename LIKE ? || '%')"
+    )
@@ -0,0 +1,73 @@
+import pytest
+
+from panoptikon.db.tags import add_tag_to_item, add_tags_to_item
+
+TAGS = [
+    ("danbooru:general", "1girl", 0.987654),
+    ("danbooru:general", "solo", 0.5),
+    ("danbooru:character", "someone", 0.123449),
+    ("danbooru:rating", "general", 1),
+]
+
+
+def add_item_data(conn, item_id: int, data_type: str) -> int:
+    conn.execute(
+        """
+        INSERT INTO items (id, sha256, md5, type, time_added)
+        VALUES (?, ?, 'md5', 'image/png', '2024-01-01T00:00:00')
+        """,
+        (item_id, f"sha256-{item_id}"),
+    )
+    conn.execute(
+        "INSERT INTO setters (name) VALUES ('tagger') ON CONFLICT DO NOTHING"
+    )
+    cursor = conn.execute(
+        """
+        INSERT INTO item_data (item_id, setter_id, data_type, idx, is_origin)
+        SELECT ?, setters.id, ?, 0, 1
+        FROM setters
+        WHERE setters.name = 'tagger'
+        """,
+        (item_id, data_type),
+    )
+    return cursor.lastrowid
+
+
+def get_item_tags(conn, data_id: int):
+    return conn.execute(
+        """
+        SELECT tags.namespace, tags.name, tags_items.confidence
+        FROM tags_items
+        JOIN tags ON tags.id = tags_items.tag_id
+        WHERE tags_items.item_data_id = ?
+        ORDER BY tags_items.rowid
+        """,
+        (data_id,),
+    ).fetchall()
+
+
+def test_add_tags_to_item_matches_add_tag_to_item(conn):
+    one_by_one = add_item_data(conn, 1, "tags")
+    for namespace, name, confidence in TAGS:
+        add_tag_to_item(conn, one_by_one, namespace, name, confidence)
+    batched = add_item_data(conn, 2, "tags")
+    add_tags_to_item(conn, batched, TAGS)
+
+    expected = get_item_tags(conn, one_by_one)
+    assert get_item_tags(conn, batched) == expected
+    assert expected[0] == ("danbooru:general", "1girl", 0.9877)
+    # Existing tags are reused rather than inserted again
+    assert conn.execute("SELECT COUNT(*) FROM tags").fetchone()[0] == 4
+
+
+def test_add_tags_to_item_without_tags(conn):
+    data_id = add_item_data(conn, 1, "tags")
+    add_tags_to_item(conn, data_id, [])
+    assert get_item_tags(conn, data_id) == []
+
+
+def test_add_tags_to_item_requires_tags_data(conn):
+    data_id = add_item_data(conn, 1, "text")
+    with pytest.raises(AssertionError):
+        add_tags_to_item(conn, data_id, TAGS)
+    assert get_item_tags(conn, data_id) == []